@@ -1,21 +1,32 @@
 
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Callable, Iterator, NamedTuple, Tuple
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+import codecs
+import errno
+import fnmatch
+import locale
+import os
+import re
+import shutil
+import stat
+import sys
+import threading
 import time
-import json
 import logging
-from enum import Enum
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.panel import Panel
-from rich.prompt import Confirm
-
-# Initialize Rich console for stderr (keeps stdout clean for piping)
-console = Console(stderr=True)
+
+# Rich submodules are imported inside the commands that use them, so that
+# --help and --version don't pay for loading tables, progress bars, etc.
+
+@lru_cache(maxsize=None)
+def _console():
+    """Return the shared Rich console for stderr (keeps stdout clean for piping)."""
+    from rich.console import Console
+    return Console(stderr=True)
+
 app = typer.Typer(
     help="✨ Modern CLI Tool - Process and manage data with style",
     no_args_is_help=True,
@@ -24,64 +35,535 @@ app = typer.Typer(
 )
 
 # Logging setup
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATEFMT = '%H:%M:%S'
+
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+_logging_configured = False
 
 def setup_logging(verbose: bool):
-    """Configure logging based on verbosity."""
+    """Configure logging based on verbosity (only the first call takes effect)."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
     level = logging.DEBUG if verbose else logging.WARNING
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
-    )
+    logging.basicConfig(level=level, format=LOG_FORMAT, datefmt=LOG_DATEFMT)
+
+@lru_cache(maxsize=None)
+def _orjson():
+    """Return the optional orjson module (much faster JSON), or None."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes, using orjson when available."""
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass  # e.g. surrogate-escaped filenames, which the stdlib can encode
+    import json
+    return json.dumps(data, separators=(",", ":")).encode()
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
 
 # ============= CORE LOGIC (Testable, Separated from CLI) =============
 
-def process_file_core(filepath: Path, transform: str = "upper") -> Dict[str, Any]:
-    """Core processing logic - pure function for testing."""
+CHUNK_SIZE = 64 * 1024  # Read/write block size for streaming file processing
+
+# Case transforms: a bytes kernel for pure-ASCII chunks plus the str
+# equivalent for everything else. Names not listed here copy files as-is.
+CaseKernel = Tuple[Callable[[bytes], bytes], Callable[[str], str]]
+_TRANSFORMS: Dict[str, CaseKernel] = {
+    "upper": (bytes.upper, str.upper),
+    "lower": (bytes.lower, str.lower),
+}
+
+def process_file_core(
+    filepath: Path,
+    transform: str = "upper",
+    output_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Core processing logic - streams the transformed file to output_dir.
+
+    The input is read and written in fixed-size chunks, so memory use stays
+    constant regardless of file size. Pure-ASCII chunks are transformed as
+    bytes; anything else is decoded first so non-ASCII letters change case
+    too. Unknown transforms copy the file unchanged. Sizes are reported in
+    bytes.
+    """
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
-    
-    content = filepath.read_text()
-    if transform == "upper":
-        result = content.upper()
-    elif transform == "lower":
-        result = content.lower()
-    else:
-        result = content
-    
+    return _transform_file(filepath, transform, _TRANSFORMS.get(transform), output_dir)
+
+def _output_path(filepath: Path, transform: str, output_dir: Optional[Path] = None) -> Path:
+    """Where the processed copy of filepath is written."""
+    return (output_dir or Path.cwd()) / f"{filepath.stem}_{transform}{filepath.suffix}"
+
+@contextmanager
+def _atomic_output(output_path: Path) -> Iterator[Path]:
+    """Yield a temporary path beside output_path, moved into place on success.
+
+    On any error the temporary file is removed, so a failed run never leaves
+    a partial output behind (or clobbers an existing one). A symlinked
+    output is followed so the link survives, and an existing output's
+    permission bits are carried over to the replacement.
+    """
+    output_path = Path(os.path.realpath(output_path))
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        yield tmp_path
+        with suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(output_path).st_mode))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+def _transform_file(
+    filepath: Path,
+    transform: str,
+    kernel: Optional[CaseKernel],
+    output_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """process_file_core with the transform already resolved to a kernel.
+
+    Lets callers handling many files look up the transform once. Unlike
+    process_file_core it doesn't check filepath exists first; the process
+    command has already validated its arguments.
+    """
+    output_path = _output_path(filepath, transform, output_dir)
+    if kernel is None:
+        # Identity transform: let the OS copy the bytes (sendfile on Linux)
+        with _atomic_output(output_path) as tmp_path:
+            shutil.copyfile(filepath, tmp_path)
+            size = os.stat(tmp_path).st_size
+        return {
+            "original_size": size,
+            "processed_size": size,
+            "transform": transform,
+            "output": output_path,
+        }
+
+    convert_bytes, convert_text = kernel
+    encoding = locale.getpreferredencoding(False)  # Same default as read_text()
+    decoder = codecs.getincrementaldecoder(encoding)()
+    original_size = processed_size = 0
+    with _atomic_output(output_path) as tmp_path, open(filepath, "rb") as src, open(tmp_path, "wb") as dst:
+        while chunk := src.read(CHUNK_SIZE):
+            original_size += len(chunk)
+            if chunk.isascii() and not decoder.getstate()[0]:
+                chunk = convert_bytes(chunk)
+            else:
+                chunk = convert_text(decoder.decode(chunk)).encode(encoding)
+            processed_size += len(chunk)
+            dst.write(chunk)
+        decoder.decode(b"", final=True)  # Reject input truncated mid-character
+
     return {
-        "original_size": len(content),
-        "processed_size": len(result),
+        "original_size": original_size,
+        "processed_size": processed_size,
         "transform": transform,
-        "result": result
+        "output": output_path,
     }
 
-def list_items_core(directory: Path, pattern: str = "*") -> List[Dict[str, Any]]:
-    """Core listing logic - returns structured data."""
-    if not directory.exists():
+# statx(2) flags and mask bits from <linux/stat.h> / <fcntl.h>
+_AT_FDCWD = -100
+_AT_SYMLINK_NOFOLLOW = 0x100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x1
+_STATX_MTIME = 0x40
+_STATX_SIZE = 0x200
+
+_statx = None  # (libc statx, buffer type) once loaded, False if unavailable
+
+def _load_statx():
+    """Return (statx function, buffer type) from libc, or None if unavailable."""
+    global _statx
+    if _statx is None:
+        _statx = (sys.platform.startswith("linux") and _bind_statx()) or False
+    return _statx or None
+
+def _bind_statx():
+    """Bind glibc's statx wrapper via ctypes; None if it doesn't exist."""
+    import ctypes
+
+    class StatxTimestamp(ctypes.Structure):
+        _fields_ = [("tv_sec", ctypes.c_int64), ("tv_nsec", ctypes.c_uint32), ("_reserved", ctypes.c_int32)]
+
+    class Statx(ctypes.Structure):
+        _fields_ = [
+            ("stx_mask", ctypes.c_uint32),
+            ("stx_blksize", ctypes.c_uint32),
+            ("stx_attributes", ctypes.c_uint64),
+            ("stx_nlink", ctypes.c_uint32),
+            ("stx_uid", ctypes.c_uint32),
+            ("stx_gid", ctypes.c_uint32),
+            ("stx_mode", ctypes.c_uint16),
+            ("_spare0", ctypes.c_uint16),
+            ("stx_ino", ctypes.c_uint64),
+            ("stx_size", ctypes.c_uint64),
+            ("stx_blocks", ctypes.c_uint64),
+            ("stx_attributes_mask", ctypes.c_uint64),
+            ("stx_atime", StatxTimestamp),
+            ("stx_btime", StatxTimestamp),
+            ("stx_ctime", StatxTimestamp),
+            ("stx_mtime", StatxTimestamp),
+            ("_spare", ctypes.c_uint64 * 16),  # Pad to the kernel's 256-byte struct
+        ]
+
+    statx = getattr(ctypes.CDLL(None, use_errno=True), "statx", None)
+    if statx is None:  # glibc < 2.28
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(Statx)]
+    statx.restype = ctypes.c_int
+    return statx, Statx
+
+# Filesystems where AT_STATX_DONT_SYNC can skip a server round trip
+_NETWORK_FS_TYPES = frozenset({"nfs", "nfs4", "cifs", "smb3", "ceph", "9p", "fuse.sshfs", "fuse.rclone"})
+
+@lru_cache(maxsize=None)
+def _mount_table() -> Tuple[Tuple[str, str], ...]:
+    """(mount point, fs type) pairs from /proc/self/mountinfo, read once per process."""
+    mounts = []
+    try:
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                fields, _, rest = line.partition(" - ")
+                # The kernel octal-escapes space, tab, newline and backslash
+                mount_point = re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), fields.split()[4])
+                mounts.append((mount_point, rest.split(" ", 1)[0]))
+    except (OSError, IndexError):
+        return ()
+    return tuple(mounts)
+
+def _is_network_fs(path: str) -> bool:
+    """Return True if path lives on a network filesystem (Linux only)."""
+    if not sys.platform.startswith("linux"):
+        return False
+    mounts = _mount_table()
+    if not any(fs_type in _NETWORK_FS_TYPES for _, fs_type in mounts):
+        return False
+    path = os.path.realpath(path)
+    best_mount, best_type = "", ""
+    for mount_point, fs_type in mounts:
+        if len(mount_point) > len(best_mount) and (
+            path == mount_point or path.startswith(mount_point.rstrip("/") + "/")
+        ):
+            best_mount, best_type = mount_point, fs_type
+    return best_type in _NETWORK_FS_TYPES
+
+def _fast_stat(
+    path: str,
+    entry: Optional[os.DirEntry] = None,
+    dont_sync: bool = True,
+    follow_symlinks: bool = True,
+) -> Tuple[int, int, float]:
+    """Return (mode, size, mtime) for path.
+
+    With dont_sync on Linux this calls statx(2) with AT_STATX_DONT_SYNC and
+    asks only for type, size and mtime, so network filesystems can answer
+    from cache. On local filesystems the ctypes call costs more than it
+    saves, so callers pass dont_sync=False there and get the DirEntry's
+    stat (free on Windows) or os.stat instead.
+    """
+    global _statx
+    loaded = _load_statx() if dont_sync else None
+    if loaded is not None:
+        import ctypes
+
+        statx, buffer_type = loaded
+        buf = buffer_type()
+        flags = _AT_STATX_DONT_SYNC | (0 if follow_symlinks else _AT_SYMLINK_NOFOLLOW)
+        if statx(_AT_FDCWD, os.fsencode(path), flags, _STATX_TYPE | _STATX_SIZE | _STATX_MTIME, buf) == 0:
+            return buf.stx_mode, buf.stx_size, buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec / 1e9
+        err = ctypes.get_errno()
+        if err not in (errno.ENOSYS, errno.EPERM):  # EPERM: blocked by a seccomp filter
+            raise OSError(err, os.strerror(err), path)
+        _statx = False
+    if entry is not None:
+        st = entry.stat(follow_symlinks=follow_symlinks)
+    else:
+        st = os.stat(path, follow_symlinks=follow_symlinks)
+    return st.st_mode, st.st_size, st.st_mtime
+
+def _stat_target(path: str, entry: Optional[os.DirEntry] = None, dont_sync: bool = False):
+    """Stat what path points to, like pathlib's is_dir()/stat() did.
+
+    Symlinks report their target's type and size; dangling symlinks (and
+    targets we may not stat) fall back to the link itself. Returns None if
+    even that fails.
+    """
+    try:
+        return _fast_stat(path, entry, dont_sync)
+    except OSError:
+        try:
+            return _fast_stat(path, entry, dont_sync, follow_symlinks=False)
+        except OSError:
+            return None
+
+def _has_wildcards(pattern: str) -> bool:
+    return any(c in pattern for c in "*?[")
+
+def _scan_entries(directory: Path, pattern: str) -> Iterator[Tuple[str, int, int, float]]:
+    """Yield (name, mode, size, mtime) for entries matching pattern, stat'ing each once.
+
+    The common shapes - ``name``, ``sub/name`` and ``[sub/]**/name`` with a
+    literal directory part - are served by os.scandir, walking
+    subdirectories with an explicit stack for ``**``. Patterns without
+    wildcards skip directory scanning entirely. Anything else (wildcards in
+    the directory part, a bare ``**``) is handed to Path.glob.
+    """
+    if not _has_wildcards(pattern):
+        result = _stat_target(os.path.join(directory, pattern))
+        if result is None:
+            if not os.path.isdir(directory):
+                raise FileNotFoundError(f"Directory not found: {directory}")
+            return
+        yield (os.path.basename(os.path.normpath(pattern)), *result)  # 'sub/' -> 'sub'
+        return
+
+    *dir_parts, name_pattern = pattern.split("/")
+    recursive = bool(dir_parts) and dir_parts[-1] == "**"
+    if recursive:
+        dir_parts.pop()
+    if "**" in name_pattern or any(_has_wildcards(part) for part in dir_parts):
+        yield from _glob_entries(directory, pattern)
+        return
+
+    root = os.path.join(directory, *dir_parts)
+    # Compile once instead of letting fnmatch() look the pattern up per entry
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    matches = re.compile(fnmatch.translate(name_pattern), flags).match
+    dont_sync = _is_network_fs(root)
+
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except (FileNotFoundError, NotADirectoryError):
+            # Only stat the listing root once something has gone missing
+            if not os.path.isdir(directory):
+                raise FileNotFoundError(f"Directory not found: {directory}") from None
+            continue
+        except PermissionError:
+            continue  # Skip unreadable directories, as pathlib's glob does
+        with it:
+            for entry in it:
+                # Like pathlib, don't descend into symlinked directories
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                if matches(entry.name):
+                    result = _stat_target(entry.path, entry, dont_sync)
+                    if result is not None:
+                        yield (entry.name, *result)
+
+def _glob_entries(directory: Path, pattern: str) -> Iterator[Tuple[str, int, int, float]]:
+    """Path.glob fallback for patterns the scandir walker doesn't handle."""
+    if not os.path.isdir(directory):
         raise FileNotFoundError(f"Directory not found: {directory}")
-    
-    items = []
     for path in directory.glob(pattern):
-        items.append({
-            "name": path.name,
-            "type": "dir" if path.is_dir() else "file",
-            "size": path.stat().st_size if path.is_file() else 0,
-            "modified": datetime.fromtimestamp(path.stat().st_mtime),
-        })
-    return sorted(items, key=lambda x: (x["type"], x["name"]))
+        result = _stat_target(str(path))
+        if result is not None:
+            yield (path.name, *result)
+
+class Item(NamedTuple):
+    """One listing entry; mtime is a POSIX timestamp, converted only for display."""
+    name: str
+    is_dir: bool
+    size: int
+    mtime: float
+
+def list_items_core(directory: Path, pattern: str = "*", sort: bool = True) -> List[Item]:
+    """Core listing logic - returns structured data.
+
+    Pass ``sort=False`` to skip ordering (directories first, then by name)
+    when the caller doesn't need it, e.g. for machine-readable output.
+    """
+    items = [
+        Item(name, stat.S_ISDIR(mode), size if stat.S_ISREG(mode) else 0, mtime)
+        for name, mode, size, mtime in _scan_entries(directory, pattern)
+    ]
+    if sort:
+        items.sort(key=lambda i: (not i.is_dir, i.name))
+    return items
+
+LIST_CACHE_MAX_AGE = 7 * 24 * 3600  # Seconds before a cached listing is evicted
+LIST_CACHE_TIMEOUT = 0.2  # Seconds to wait on a locked cache before scanning instead
+
+def _list_cache_path() -> Path:
+    """Location of the on-disk listing cache (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "modern-cli" / "list-cache.db"
+
+def list_items_cached(directory: Path, pattern: str = "*", sort: bool = True) -> List[Item]:
+    """list_items_core, memoized on disk until the scanned directory changes.
+
+    Entries are keyed on (directory, pattern) and reused while the scanned
+    directory's mtime is unchanged, which covers entries being added,
+    removed or renamed. Edits to an existing file's contents don't touch
+    the directory mtime, so cached sizes/times can be stale; recursive
+    ``**`` patterns are never cached for the same reason. Rows not rewritten
+    within LIST_CACHE_MAX_AGE seconds are evicted whenever a new one is stored.
+    """
+    import sqlite3
+    from contextlib import closing
+
+    pattern_dir = os.path.dirname(pattern)
+    if "**" in pattern or _has_wildcards(pattern_dir):
+        return list_items_core(directory, pattern, sort)
+
+    scan_dir = os.path.abspath(os.path.join(directory, pattern_dir))
+    try:
+        mtime_ns = os.stat(scan_dir).st_mtime_ns
+    except OSError:
+        return list_items_core(directory, pattern, sort)  # Let the core report it
+
+    # Any failure to read, decode, encode or store a cache row is treated
+    # as a miss: the cache must never make a listing fail.
+    cache_errors = (sqlite3.Error, OSError, ValueError, TypeError)
+    cache_path = _list_cache_path()
+    items = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(cache_path, timeout=LIST_CACHE_TIMEOUT)) as db, db:
+            db.execute("DROP TABLE IF EXISTS list_cache")  # Pre-eviction schema
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS list_cache_v2 ("
+                "directory TEXT, pattern TEXT, mtime_ns INTEGER, items BLOB, stored_at REAL, "
+                "PRIMARY KEY (directory, pattern))"
+            )
+            row = db.execute(
+                "SELECT items FROM list_cache_v2 "
+                "WHERE directory = ? AND pattern = ? AND mtime_ns = ? AND stored_at >= ?",
+                (scan_dir, pattern, mtime_ns, time.time() - LIST_CACHE_MAX_AGE),
+            ).fetchone()
+            if row is not None:
+                items = [Item(*fields) for fields in _load_json(row[0])]
+                logger.debug("List cache hit for %s", scan_dir)
+    except cache_errors as e:
+        logger.debug("List cache unreadable (%s), scanning directly", e)
+        items = None
+
+    if items is None:
+        items = list_items_core(directory, pattern, sort=False)
+        try:
+            now = time.time()
+            with closing(sqlite3.connect(cache_path, timeout=LIST_CACHE_TIMEOUT)) as db, db:
+                db.execute("DELETE FROM list_cache_v2 WHERE stored_at < ?", (now - LIST_CACHE_MAX_AGE,))
+                db.execute(
+                    "INSERT OR REPLACE INTO list_cache_v2 VALUES (?, ?, ?, ?, ?)",
+                    (scan_dir, pattern, mtime_ns, _dump_json([tuple(i) for i in items]), now),
+                )
+        except cache_errors as e:
+            logger.debug("List cache not updated (%s)", e)
+
+    if sort:
+        items.sort(key=lambda i: (not i.is_dir, i.name))
+    return items
+
+def _item_record(item: Item) -> Dict[str, Any]:
+    """JSON-ready form of an Item for scripting output."""
+    return {
+        "name": item.name,
+        "type": "dir" if item.is_dir else "file",
+        "size": item.size,
+        "mtime": item.mtime,
+    }
 
 # ============= CLI COMMANDS =============
 
+def _write_json_items(out, items: List[Item], json_lines: bool = False):
+    """Stream items to a binary stream as a JSON array, or one object per line.
+
+    Each record is encoded and written on its own, so the full document is
+    never held in memory.
+    """
+    if json_lines:
+        for item in items:
+            out.write(_dump_json(_item_record(item)) + b"\n")
+        return
+    out.write(b"[")
+    for index, item in enumerate(items):
+        out.write(b",\n  " if index else b"\n  ")
+        out.write(_dump_json(_item_record(item)))
+    out.write(b"\n]\n" if items else b"]\n")
+
+def _check_files_exist(args: List[str]) -> List[Path]:
+    """Validate that every path is an existing, readable non-directory, like
+    typer's exists=True/dir_okay=False/readable=True, and return them as Paths.
+
+    One os.stat plus one access() check per argument; scanning parent
+    directories instead was measured slower, since its cost grows with the
+    directory's size rather than the number of arguments.
+    """
+    for arg in args:
+        try:
+            st = os.stat(arg)
+        except OSError:
+            raise typer.BadParameter(f"File '{arg}' does not exist.", param_hint="'files'") from None
+        if stat.S_ISDIR(st.st_mode):
+            raise typer.BadParameter(f"File '{arg}' is a directory.", param_hint="'files'")
+        if not os.access(arg, os.R_OK):
+            raise typer.BadParameter(f"File '{arg}' is not readable.", param_hint="'files'")
+    return [Path(arg) for arg in args]
+
+def _format_mtime(mtime: float) -> str:
+    """Format a timestamp as local 'YYYY-MM-DD HH:MM' without strftime parsing."""
+    t = time.localtime(mtime)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}"
+
+TABLE_PAGE_SIZE = 1000  # Rows per Rich table when printing large listings
+PROGRESS_REFRESH_HZ = 4  # Max redraws per second of the process progress bar
+
+def _print_table_pages(console, rows: List[Tuple[str, ...]], title: str, caption: str, show_lines: bool):
+    """Print listing rows as Rich tables of at most TABLE_PAGE_SIZE rows each.
+
+    Rendering one huge table makes Rich measure and lay out every row at
+    once; paging bounds that work. Column widths are fixed from the full
+    row set so consecutive pages line up.
+    """
+    from rich.cells import cell_len
+    from rich.table import Table
+
+    paged = len(rows) > TABLE_PAGE_SIZE
+    widths = [max(map(cell_len, column)) for column in zip(*rows)] if paged else [None] * 4
+    for start in range(0, max(len(rows), 1), TABLE_PAGE_SIZE):
+        last = start + TABLE_PAGE_SIZE >= len(rows)
+        table = Table(
+            title=title if start == 0 else None,
+            caption=caption if last else None,
+            show_lines=show_lines,
+        )
+        table.add_column("Name", style="cyan", no_wrap=True, min_width=widths[0])
+        table.add_column("Type", style="magenta", min_width=widths[1])
+        table.add_column("Size", justify="right", style="green", min_width=widths[2])
+        table.add_column("Modified", style="yellow", min_width=widths[3])
+        for row in rows[start:start + TABLE_PAGE_SIZE]:
+            table.add_row(*row)
+        console.print(table)
+
+
 @app.command()
 def process(
-    files: List[Path] = typer.Argument(
+    # Plain strings, validated by _check_files_exist: Path conversion would
+    # drop trailing slashes before we could reject them.
+    files: List[str] = typer.Argument(
         ...,
         help="Files to process",
-        exists=True,
-        file_okay=True,
-        dir_okay=False,
     ),
     transform: str = typer.Option(
         "upper",
@@ -115,8 +597,15 @@ def process(
     ),
 ):
     """Process files with transformations and Rich feedback."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    console = _console()
     setup_logging(verbose)
-    logger.debug(f"Processing {len(files)} files with transform={transform}")
+    logger.debug("Processing %d files with transform=%s", len(files), transform)
+    files = _check_files_exist(files)
     
     # Confirmation for multiple files
     if len(files) > 1 and not yes and not dry_run:
@@ -132,39 +621,75 @@ def process(
             console.print(f"  Would process: {file.name} → {transform}")
         raise typer.Exit(code=0)
     
-    output_dir = output_dir or Path.cwd()
-    
-    # Process with progress bar
     errors = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing files...", total=len(files))
-        
-        for file in files:
-            try:
-                logger.debug(f"Processing {file}")
-                result = process_file_core(file, transform)
-                
-                # Write output
-                output_path = output_dir / f"{file.stem}_{transform}{file.suffix}"
-                output_path.write_text(result["result"])
-                
-                progress.update(
-                    task,
-                    advance=1,
-                    description=f"✓ {file.name}"
-                )
-                logger.info(f"Wrote {result['processed_size']} bytes to {output_path}")
-                
-            except Exception as e:
-                errors.append((file, str(e)))
-                progress.update(task, advance=1, description=f"✗ {file.name}")
-                logger.error(f"Failed to process {file}: {e}")
+    progress = None
+    last_refresh = 0.0
+
+    def finish(file: Path, run) -> None:
+        """Collect one file's outcome and advance the progress bar, if any."""
+        nonlocal last_refresh
+        try:
+            result = run()
+        except Exception as e:
+            errors.append((file, str(e)))
+            mark = "✗"
+            logger.error("Failed to process %s: %s", file, e)
+        else:
+            mark = "✓"
+            logger.info("Wrote %d bytes to %s", result["processed_size"], result["output"])
+        if progress is not None:
+            progress.update(task, advance=1, description=f"{mark} {file.name}")
+            # Redraw at most PROGRESS_REFRESH_HZ times a second, plus once at the end
+            now = time.monotonic()
+            if now - last_refresh >= 1 / PROGRESS_REFRESH_HZ or progress.finished:
+                progress.refresh()
+                last_refresh = now
+
+    kernel = _TRANSFORMS.get(transform)  # Resolved once for every file
+    if len(files) == 1:
+        # A single file finishes too quickly for a progress bar to help
+        logger.debug("Processing %s", files[0])
+        finish(files[0], lambda: _transform_file(files[0], transform, kernel, output_dir))
+    else:
+        # Process with progress bar, redrawn only when files complete
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            auto_refresh=False,
+        ) as progress:
+            task = progress.add_task("Processing files...", total=len(files))
+
+            # Inputs that map to an output path already claimed (e.g. a/m.txt
+            # and b/m.txt) run afterwards, in order, so the last one wins as
+            # it would sequentially instead of racing on the same file.
+            claimed = set()
+            parallel, deferred = [], []
+            for file in files:
+                output_key = os.path.normcase(_output_path(file, transform, output_dir))
+                (deferred if output_key in claimed else parallel).append(file)
+                claimed.add(output_key)
+
+            # File I/O releases the GIL, so threads overlap reads and writes
+            with ThreadPoolExecutor(max_workers=min(32, len(parallel))) as executor:
+                try:
+                    futures = {}
+                    for file in parallel:
+                        logger.debug("Processing %s", file)
+                        futures[executor.submit(_transform_file, file, transform, kernel, output_dir)] = file
+                    for future in as_completed(futures):
+                        finish(futures[future], future.result)
+                except BaseException:
+                    # Ctrl-C (or any failure here) stops the batch like the old
+                    # sequential loop: drop queued files instead of draining them
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+            for file in deferred:
+                logger.debug("Processing %s", file)
+                finish(file, lambda: _transform_file(file, transform, kernel, output_dir))
     
     # Summary panel
     if errors:
@@ -200,6 +725,18 @@ def list(
         help="Output as JSON",
         rich_help_panel="Output Options",
     ),
+    json_lines: bool = typer.Option(
+        False,
+        "--jsonl",
+        help="Output as JSON Lines (one object per line)",
+        rich_help_panel="Output Options",
+    ),
+    use_cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse cached results while the directory is unchanged",
+        rich_help_panel="Advanced Options",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose", "-v",
@@ -208,45 +745,49 @@ def list(
     ),
 ):
     """List directory contents in a beautiful table."""
+    console = _console()
     setup_logging(verbose)
-    logger.debug(f"Listing {directory} with pattern={pattern}")
+    logger.debug("Listing %s with pattern=%s", directory, pattern)
     
     try:
-        items = list_items_core(directory, pattern)
+        machine_output = json_output or json_lines
+        list_items = list_items_cached if use_cache else list_items_core
+        items = list_items(directory, pattern, sort=not machine_output)
         
-        if json_output:
-            # Machine-readable output for scripting
-            output = json.dumps(
-                [{"name": i["name"], "type": i["type"], "size": i["size"]} for i in items],
-                indent=2
-            )
-            typer.echo(output)  # Use echo for stdout
+        if machine_output:
+            # Machine-readable output for scripting, streamed as raw bytes to stdout
+            _write_json_items(sys.stdout.buffer, items, json_lines)
+            sys.stdout.buffer.flush()  # Surface a closed pipe here, not at exit
         else:
             # Human-readable Rich table
-            table = Table(
+            # Format rows and total the sizes in a single pass
+            rows = []
+            total_size = 0
+            for i in items:
+                total_size += i.size
+                rows.append((
+                    i.name,
+                    "dir" if i.is_dir else "file",
+                    "-" if i.is_dir else f"{i.size:,}",
+                    _format_mtime(i.mtime),
+                ))
+            _print_table_pages(
+                console,
+                rows,
                 title=f"📁 {directory.resolve()}",
                 caption=f"Found {len(items)} items matching '{pattern}'",
-                show_lines=True,
+                show_lines=verbose,
             )
-            table.add_column("Name", style="cyan", no_wrap=True)
-            table.add_column("Type", style="magenta")
-            table.add_column("Size", justify="right", style="green")
-            table.add_column("Modified", style="yellow")
-            
-            for item in items:
-                size_str = f"{item['size']:,}" if item['type'] == 'file' else "-"
-                table.add_row(
-                    item["name"],
-                    item["type"],
-                    size_str,
-                    item["modified"].strftime("%Y-%m-%d %H:%M"),
-                )
-            
-            console.print(table)
             
             if verbose:
-                console.print(f"\n[dim]Total size: {sum(i['size'] for i in items):,} bytes[/dim]")
+                console.print(f"\n[dim]Total size: {total_size:,} bytes[/dim]")
                 
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); that's not an error for us.
+        # Point stdout at devnull so the interpreter's final flush stays quiet.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        raise typer.Exit(code=0)
     except FileNotFoundError as e:
         console.print(f"[red]Error: {e}[/red]")
         console.print("[yellow]Tip: Check the path exists and you have read permissions[/yellow]")
@@ -267,7 +808,7 @@ def main_callback(
 ):
     """Modern CLI with beautiful, user-friendly output."""
     if version:
-        console.print("[bold cyan]modern-cli[/bold cyan] version 1.0.0")
+        _console().print("[bold cyan]modern-cli[/bold cyan] version 1.0.0")
         raise typer.Exit()
 
 if __name__ == "__main__":